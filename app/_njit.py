@@ -0,0 +1,27 @@
+"""Optional numba ``njit`` decorator.
+
+Falls back to an identity decorator when numba is not installed, so the
+kernels in :mod:`app.indicators` still run (interpreted) without it.
+"""
+from __future__ import annotations
+
+try:
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Identity replacement for ``numba.njit``."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# fastmath without the "nnan"/"ninf" flags: indicator arrays carry NaN
+# warm-up values, which full fastmath would let LLVM assume away.
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+__all__ = ["FASTMATH", "njit"]
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections import deque
-from typing import Deque, Dict, List
+import math
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Dict, List, Tuple
 
 import numpy as np
 
@@ -15,6 +17,28 @@ from .risk_guard import RiskGuard
 
 logger = logging.getLogger(__name__)
 
+_MAX_CANDLES = 500
+_EVAL_INTERVAL = 1.0  # seconds, minimum gap between evaluations
+
+
+@dataclass(slots=True, frozen=True)
+class SizingParams:
+    """Per-engine constants needed to size an entry outside the engine."""
+
+    max_sl_pct: float
+    atr_mult_stop: float
+    leverage: float
+    qty_step: float
+    qty_digits: int
+
+
+@dataclass(slots=True)
+class Position:
+    side: str  # "long" | "short"
+    qty: float
+    order_id: str
+    side_is_long: bool
+
 
 class MeanReversionEngine:
     """Aggregates ticks into 1-min candles, runs strategy, sends orders."""
@@ -26,6 +50,7 @@ class MeanReversionEngine:
         notifier: TelegramNotifier,
         risk_guard: RiskGuard,
         settings: dict,
+        entry_sink: Callable[[MeanReversionEngine, Tuple[str, float, float] | None], None] | None = None,
     ) -> None:
         self.symbol = symbol
         self.exchange = exchange
@@ -33,10 +58,33 @@ class MeanReversionEngine:
         self.risk_guard = risk_guard
         self.settings = settings
         self.strategy = MeanReversionSignal()
+        # When set, entry candidates (side, close, atr) are handed to the
+        # manager for batched sizing instead of being opened here; ``None``
+        # withdraws a candidate whose signal is gone.
+        self._entry_sink = entry_sink
+        self._lev = float(settings.get("leverage", 10))
+        self._qty_step = float(settings.get("qty_step", 0.001))
+        self._inv_step = 1.0 / self._qty_step
+        # decimals of qty_step, to strip float noise from the floored qty
+        self._qty_digits = max(0, -Decimal(str(self._qty_step)).as_tuple().exponent)
+        self.sizing = SizingParams(
+            max_sl_pct=self.strategy.max_sl_pct,
+            atr_mult_stop=self.strategy.atr_mult_stop,
+            leverage=self._lev,
+            qty_step=self._qty_step,
+            qty_digits=self._qty_digits,
+        )
 
-        self.ticks: Deque[dict] = deque(maxlen=60)
-        self.candles: List[np.ndarray] = []  # rows: [ts, open, high, low, close, volume]
-        self.position: dict | None = None
+        # Mirrored ring buffer: row i is also written at i + _MAX_CANDLES so the
+        # last _MAX_CANDLES candles are always one contiguous slice.
+        # rows: [ts, open, high, low, close, volume]
+        self._cbuf = np.empty((2 * _MAX_CANDLES, 6), dtype=np.float64)
+        self._cn = 0  # candles written so far
+        # Running aggregate of the current minute: [open, high, low, close, volume]
+        self._cur_minute: int = -1
+        self._cur_ohlcv: List[float] | None = None
+        self._wake = asyncio.Event()  # set by _on_trade when new trades arrive
+        self.position: Position | None = None
         self.entry_price: float = 0.0
 
     # ----------------------------------------------------------
@@ -44,8 +92,32 @@ class MeanReversionEngine:
     # ----------------------------------------------------------
 
     def _on_trade(self, data: dict) -> None:
-        for tr in data.get("data", []):
-            self.ticks.append(tr)
+        # A publicTrade frame carries a burst of trades: parse it in one pass
+        ticks = [(int(tr["T"]), float(tr["p"]), float(tr["v"])) for tr in data.get("data", ())]
+        if not ticks:
+            return
+        aggregate = self._aggregate
+        for ts_ms, price, vol in ticks:
+            aggregate(ts_ms, price, vol)
+        self._wake.set()
+
+    def _aggregate(self, ts_ms: int, price: float, vol: float) -> None:
+        minute = ts_ms // 60000
+        cur = self._cur_ohlcv
+        if minute != self._cur_minute:
+            if minute < self._cur_minute:
+                return  # late trade for an already closed minute
+            if cur is not None:
+                self._store_candle()
+            self._cur_minute = minute
+            self._cur_ohlcv = [price, price, price, price, vol]
+            return
+        if price > cur[1]:
+            cur[1] = price
+        elif price < cur[2]:
+            cur[2] = price
+        cur[3] = price
+        cur[4] += vol
 
     async def start(self) -> None:
         topic = f"publicTrade.{self.symbol}"
@@ -59,63 +131,89 @@ class MeanReversionEngine:
 
     async def _run_loop(self) -> None:
         while True:
+            # Idle symbols sleep here instead of re-evaluating unchanged candles
+            await self._wake.wait()
+            self._wake.clear()
             try:
                 await self._build_candle()
                 await self._evaluate()
             except Exception as exc:  # pylint: disable=broad-except
                 logger.exception("Engine error: %s", exc)
-            await asyncio.sleep(1)
+            await asyncio.sleep(_EVAL_INTERVAL)
 
     async def _build_candle(self) -> None:
-        if not self.ticks:
-            return
-        now = int(self.ticks[-1]["T"] // 1000)  # seconds
-        minute = now - (now % 60)
-        minute_ticks = [t for t in self.ticks if int(t["T"] // 1000) - (int(t["T"] // 1000) % 60) == minute]
-        if not minute_ticks:
+        if self._cur_ohlcv is None:
             return
-        prices = np.array([float(t["p"]) for t in minute_ticks])
-        vol = sum(float(t["v"]) for t in minute_ticks)
-        candle = np.array([minute, prices[0], prices.max(), prices.min(), prices[-1], vol])
-        if self.candles and self.candles[-1][0] == minute:
-            self.candles[-1] = candle
-        else:
-            self.candles.append(candle)
-        # Keep last 500 candles
-        if len(self.candles) > 500:
-            self.candles = self.candles[-500:]
+        self._store_candle()
+
+    def _store_candle(self) -> None:
+        """Write the running aggregate as the last candle (update or append)."""
+        minute = self._cur_minute * 60  # seconds
+        row = (self._cn - 1) % _MAX_CANDLES
+        if not self._cn or self._cbuf[row, 0] != minute:
+            row = self._cn % _MAX_CANDLES
+            self._cn += 1
+        self._cbuf[row, 0] = minute
+        self._cbuf[row, 1:] = self._cur_ohlcv
+        self._cbuf[row + _MAX_CANDLES] = self._cbuf[row]
+
+    def _contiguous(self) -> np.ndarray:
+        """Zero-copy view of the stored candles, oldest first."""
+        if self._cn <= _MAX_CANDLES:
+            return self._cbuf[: self._cn]
+        start = self._cn % _MAX_CANDLES
+        return self._cbuf[start : start + _MAX_CANDLES]
 
     async def _evaluate(self) -> None:
-        if len(self.candles) < 100:
+        if self._cn < 100:
             return
-        candles_np = np.vstack(self.candles)
-        signal = self.strategy.generate(candles_np)
+        candles_np = self._contiguous()
+        ind = self.strategy._indicators_incremental(candles_np)
+        signal = self.strategy.generate_from_ind(ind)
+        if self._entry_sink is not None and (signal == "none" or self.position is not None):
+            self._entry_sink(self, None)
         if signal == "none":
             if self.position:
-                exit_, price = self.strategy.should_exit(
-                    self.position["side"].lower(), candles_np, self.entry_price
+                exit_, price = self.strategy.should_exit_from_ind(
+                    self.position.side, ind, self.entry_price
                 )
                 if exit_:
                     await self._close_position(price)
             return
 
         # Entry
-        if self.position is None and self.risk_guard.is_trading_allowed():
-            await self._open_position(signal, candles_np)
+        if self.position is not None:
+            return
+        if not self.risk_guard.is_trading_allowed():
+            if self._entry_sink is not None:
+                self._entry_sink(self, None)
+            return
+        if self._entry_sink is not None:
+            self._entry_sink(self, (signal, float(candles_np[-1, 4]), float(ind["atr"][-1])))
+        else:
+            await self._open_position(signal, candles_np, ind)
 
     # ----------------------------------------------------------
     # Orders & risk
     # ----------------------------------------------------------
 
-    async def _open_position(self, side: str, candles: np.ndarray) -> None:
+    async def _open_position(
+        self, side: str, candles: np.ndarray, ind: Dict[str, np.ndarray]
+    ) -> None:
+        # ``candles`` is a view of the live buffer; read it before awaiting.
+        close = float(candles[-1, 4])
+        atr_val = float(ind["atr"][-1])
         balance = await self.exchange.wallet_balance()
-        close = candles[-1, 4]
-        atr_val = self.strategy._indicators(candles)["atr"][-1]
         sl_price = self.strategy.initial_sl(side, atr_val, close)
         risk_per_trade = self.settings["risk_per_trade"]  # fraction, e.g. 0.01
         risk_usdt = balance * risk_per_trade
         qty = self._safe_qty_calc(risk_usdt, abs(close - sl_price), close)
-        qty = round(qty, self.settings.get("qty_step", 0.001))
+        qty = self._floor_qty(qty)
+        await self.submit_entry(side, close, sl_price, qty, risk_usdt)
+
+    async def submit_entry(
+        self, side: str, close: float, sl_price: float, qty: float, risk_usdt: float
+    ) -> None:
         if qty <= 0:
             logger.warning("Qty calculated as zero. Skipping")
             return
@@ -131,30 +229,34 @@ class MeanReversionEngine:
             reduce_only=False,
             sl=sl_price,
         )
-        self.position = {"side": side, "qty": qty, "order_id": order["result"]["orderId"]}
+        self.position = Position(side, qty, order["result"]["orderId"], side == "long")
         self.entry_price = close
-        await self.notifier.send(f"\ud83d\ude80 Open {side.upper()} {self.symbol} qty={qty} entry={close:.2f}")
+        self.notifier.send(f"\ud83d\ude80 Open {side.upper()} {self.symbol} qty={qty} entry={close:.2f}")
 
     async def _close_position(self, price: float) -> None:
         if not self.position:
             return
-        side = "Sell" if self.position["side"] == "long" else "Buy"
+        side = "Sell" if self.position.side_is_long else "Buy"
         await self.exchange.create_order(
             symbol=self.symbol,
             side=side,
             order_type="Market",
-            qty=self.position["qty"],
+            qty=self.position.qty,
             reduce_only=True,
         )
         pnl_pct = (price - self.entry_price) / self.entry_price * (1 if side == "Sell" else -1) * 100
         self.risk_guard.register_trade(pnl_pct, 0.0)
-        await self.notifier.send(f"\u2705 Close {self.symbol} {pnl_pct:.2f} %")
+        self.notifier.send(f"\u2705 Close {self.symbol} {pnl_pct:.2f} %")
         self.position = None
 
     # ----------------------------------------------------------
 
+    def _floor_qty(self, qty: float) -> float:
+        """Round ``qty`` down to a multiple of ``qty_step``."""
+        steps = math.floor(qty * self._inv_step + 1e-9)
+        return round(steps * self._qty_step, self._qty_digits)
+
     def _safe_qty_calc(self, risk_usdt: float, stop_dist: float, price: float) -> float:
-        if stop_dist == 0:
-            return 0.0
-        raw_qty = risk_usdt / stop_dist
-        return raw_qty * self.settings.get("leverage", 10)
+        # zero stop distance -> zero qty, without a branch on the common path
+        raw_qty = risk_usdt / (stop_dist or 1e-12)
+        return raw_qty * self._lev * (stop_dist != 0)
@@ -4,21 +4,42 @@ Only endpoints and topics required by the spec are implemented.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import hmac
 import json
 import logging
 import time
 from typing import Any, Callable, Dict, List
+from urllib.parse import urlencode
 
 import aiohttp
-from pybit.unified_trading import HTTP as BybitHTTP
+
+try:
+    import orjson  # type: ignore
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except Exception:  # pragma: no cover - optional dependency
+    _loads = json.loads
+    _dumps = json.dumps
 
 # Constants
 _WS_PUBLIC_ENDPOINT = "wss://stream.bybit.com/v5/public/linear"
+_REST_ENDPOINT = "https://api.bybit.com"
+_REST_TESTNET_ENDPOINT = "https://api-testnet.bybit.com"
+_RECV_WINDOW = "5000"
 _SYMBOL_SUFFIX = "USDT"
 
 logger = logging.getLogger(__name__)
 
 
+class BybitError(RuntimeError):
+    """Raised when the REST API answers with a non-zero ``retCode``."""
+
+
 class Exchange:
     """Unified thin wrapper around Bybit HTTP & WebSocket v5."""
 
@@ -29,12 +50,11 @@ class Exchange:
         testnet: bool = True,
         session: aiohttp.ClientSession | None = None,
     ) -> None:
-        self._http = BybitHTTP(
-            api_key=api_key,
-            api_secret=api_secret,
-            testnet=testnet,
-        )
+        self._api_key = api_key
+        self._api_secret = api_secret.encode()
+        self._rest_url = _REST_TESTNET_ENDPOINT if testnet else _REST_ENDPOINT
         self._session = session or aiohttp.ClientSession()
+        self._rest_timeout = aiohttp.ClientTimeout(total=10)
         self._ws: aiohttp.ClientWebSocketResponse | None = None
         self._subscriptions: dict[str, list[Callable[[dict[str, Any]], None]]] = {}
         self._connect_lock = asyncio.Lock()
@@ -43,6 +63,41 @@ class Exchange:
     # HTTP
     # ---------------------------------------------------------------------
 
+    async def _signed_request(self, method: str, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Send a v5 request signed with HMAC-SHA256 and return the decoded body."""
+        timestamp = str(int(time.time() * 1000))
+        if method == "GET":
+            payload = urlencode(params)
+            url = f"{self._rest_url}{path}?{payload}" if payload else f"{self._rest_url}{path}"
+            body = None
+        else:
+            payload = _dumps(params)
+            url = f"{self._rest_url}{path}"
+            body = payload
+        sign = hmac.new(
+            self._api_secret,
+            (timestamp + self._api_key + _RECV_WINDOW + payload).encode(),
+            hashlib.sha256,
+        ).hexdigest()
+        headers = {
+            "X-BAPI-API-KEY": self._api_key,
+            "X-BAPI-TIMESTAMP": timestamp,
+            "X-BAPI-RECV-WINDOW": _RECV_WINDOW,
+            "X-BAPI-SIGN": sign,
+            "X-BAPI-SIGN-TYPE": "2",
+            "Content-Type": "application/json",
+        }
+        async with self._session.request(
+            method, url, data=body, headers=headers, timeout=self._rest_timeout
+        ) as resp:
+            raw = await resp.read()
+            if resp.status != 200:
+                raise BybitError(f"{path} failed: HTTP {resp.status} {raw[:200]!r}")
+            r = _loads(raw)
+        if r.get("retCode") != 0:
+            raise BybitError(f"{path} failed: {r.get('retCode')} {r.get('retMsg')}")
+        return r
+
     async def create_order(
         self,
         symbol: str,
@@ -73,21 +128,21 @@ class Exchange:
         if sl is not None:
             params["stopLoss"] = str(sl)
         logger.debug("Create order params: %s", params)
-        return self._http.post("/v5/order/create", params=params)
+        return await self._signed_request("POST", "/v5/order/create", params)
 
     async def cancel_order(self, symbol: str, order_id: str) -> dict[str, Any]:
         params = {"category": "linear", "symbol": symbol, "orderId": order_id}
-        return self._http.post("/v5/order/cancel", params=params)
+        return await self._signed_request("POST", "/v5/order/cancel", params)
 
     async def positions(self, symbol: str | None = None) -> list[dict[str, Any]]:
         params: dict[str, Any] = {"category": "linear"}
         if symbol:
             params["symbol"] = symbol
-        r = self._http.get("/v5/position/list", params=params)
+        r = await self._signed_request("GET", "/v5/position/list", params)
         return r["result"]["list"]
 
     async def wallet_balance(self) -> float:
-        r = self._http.get("/v5/account/wallet-balance", params={"accountType": "UNIFIED"})
+        r = await self._signed_request("GET", "/v5/account/wallet-balance", {"accountType": "UNIFIED"})
         usdt = next((a for a in r["result"]["list"] if a["coin"] == _SYMBOL_SUFFIX), None)
         return float(usdt["availableBalance"]) if usdt else 0.0
 
@@ -108,7 +163,7 @@ class Exchange:
 
     async def _send_ws(self, msg: dict[str, Any]) -> None:
         assert self._ws is not None, "WebSocket not connected"
-        await self._ws.send_str(json.dumps(msg))
+        await self._ws.send_str(_dumps(msg))
 
     async def subscribe(self, topic: str, callback: Callable[[dict[str, Any]], None]) -> None:
         self._subscriptions.setdefault(topic, []).append(callback)
@@ -118,11 +173,11 @@ class Exchange:
     async def _listen(self) -> None:
         assert self._ws is not None
         async for msg in self._ws:
-            if msg.type == aiohttp.WSMsgType.TEXT:
-                data = msg.json(loads=json.loads)
-                topic = data.get("topic")
-                if topic and topic in self._subscriptions:
-                    for cb in self._subscriptions[topic]:
+            if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                data = _loads(msg.data)
+                callbacks = self._subscriptions.get(data.get("topic"))
+                if callbacks:
+                    for cb in callbacks:
                         cb(data)
             elif msg.type == aiohttp.WSMsgType.ERROR:
                 logger.error("WS error %s", msg.data)
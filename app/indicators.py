@@ -1,16 +1,60 @@
-"""Indicator implementations using numpy only."""
+"""Indicator implementations using numpy (+ optional numba kernels)."""
 from __future__ import annotations
 
 import numpy as np
 
+from ._njit import FASTMATH, njit
 
-def _rolling_window(arr: np.ndarray, window: int) -> np.ndarray:
-    """Return 2-d view of the array with sliding window."""
-    if window > arr.size:
-        raise ValueError("window too large")
-    shape = arr.shape[:-1] + (arr.shape[-1] - window + 1, window)
-    strides = arr.strides + (arr.strides[-1],)
-    return np.lib.stride_tricks.as_strided(arr, shape=shape, strides=strides)
+
+# ----------------------------------------------------------------------
+# Wilder smoothing kernels
+# ----------------------------------------------------------------------
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _rsi_loop(gain: np.ndarray, loss: np.ndarray, period: int) -> tuple[np.ndarray, np.ndarray]:
+    n = gain.shape[0]
+    avg_gain = np.full(n, np.nan, dtype=gain.dtype)
+    avg_loss = np.full(n, np.nan, dtype=gain.dtype)
+    if n <= period:
+        return avg_gain, avg_loss
+    avg_gain[period] = gain[1 : period + 1].mean()
+    avg_loss[period] = loss[1 : period + 1].mean()
+    for i in range(period + 1, n):
+        avg_gain[i] = (avg_gain[i - 1] * (period - 1) + gain[i]) / period
+        avg_loss[i] = (avg_loss[i - 1] * (period - 1) + loss[i]) / period
+    return avg_gain, avg_loss
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _atr_loop(tr: np.ndarray, period: int) -> np.ndarray:
+    n = tr.shape[0]
+    out = np.full(n, np.nan, dtype=tr.dtype)
+    if n <= period:
+        return out
+    out[period] = tr[1 : period + 1].mean()
+    for i in range(period + 1, n):
+        out[i] = (out[i - 1] * (period - 1) + tr[i]) / period
+    return out
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _adx_loop(dx: np.ndarray, period: int) -> np.ndarray:
+    n = dx.shape[0]
+    out = np.full(n, np.nan, dtype=dx.dtype)
+    if n <= 2 * period:
+        return out
+    # nanmean of the seed window, NaN (without a warning) if it is all NaN
+    total = 0.0
+    count = 0
+    for i in range(period, 2 * period + 1):
+        if not np.isnan(dx[i]):
+            total += dx[i]
+            count += 1
+    out[2 * period] = total / count if count else np.nan
+    for i in range(2 * period + 1, n):
+        out[i] = (out[i - 1] * (period - 1) + dx[i]) / period
+    return out
 
 
 # ----------------------------------------------------------------------
@@ -18,20 +62,204 @@ def _rolling_window(arr: np.ndarray, window: int) -> np.ndarray:
 # ----------------------------------------------------------------------
 
 
+@njit(cache=True, fastmath=FASTMATH)
+def _move_mean(arr: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean via a running sum: one pass, no window temporaries."""
+    n = arr.shape[0]
+    out = np.full(n, np.nan, dtype=arr.dtype)
+    s = 0.0
+    for i in range(n):
+        s += np.float64(arr[i])
+        if i >= window:
+            s -= np.float64(arr[i - window])
+        if i >= window - 1:
+            out[i] = s / window
+    return out
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _move_std(arr: np.ndarray, window: int) -> np.ndarray:
+    """Rolling population std via running sum and sum of squares."""
+    n = arr.shape[0]
+    out = np.full(n, np.nan, dtype=arr.dtype)
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        x = np.float64(arr[i])  # float64 accumulators, also for float32 input
+        s += x
+        s2 += x * x
+        if i >= window:
+            y = np.float64(arr[i - window])
+            s -= y
+            s2 -= y * y
+        if i >= window - 1:
+            mean = s / window
+            out[i] = np.sqrt(max(s2 / window - mean * mean, 0.0))
+    return out
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _bb_loop(close: np.ndarray, window: int, k: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger bands in one pass sharing the running sum and sum of squares."""
+    n = close.shape[0]
+    lower = np.full(n, np.nan, dtype=close.dtype)
+    mid = np.full(n, np.nan, dtype=close.dtype)
+    upper = np.full(n, np.nan, dtype=close.dtype)
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        x = np.float64(close[i])  # float64 accumulators, also for float32 input
+        s += x
+        s2 += x * x
+        if i >= window:
+            y = np.float64(close[i - window])
+            s -= y
+            s2 -= y * y
+        if i >= window - 1:
+            mean = s / window
+            sd = np.sqrt(max(s2 / window - mean * mean, 0.0))
+            lower[i] = mean - k * sd
+            mid[i] = mean
+            upper[i] = mean + k * sd
+    return lower, mid, upper
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _compute_all(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    w_bb: int,
+    p_rsi: int,
+    p_atr: int,
+    p_adx: int,
+    k: float,
+):
+    """Bollinger bands, RSI, ATR and ADX in a single pass over the rows.
+
+    Same definitions (seeds, warm-up NaNs) as the standalone indicators;
+    every accumulator is advanced once per row so each row is read once.
+    """
+    n = close.shape[0]
+    lower = np.full(n, np.nan, dtype=close.dtype)
+    mid = np.full(n, np.nan, dtype=close.dtype)
+    upper = np.full(n, np.nan, dtype=close.dtype)
+    rsi_out = np.full(n, np.nan, dtype=close.dtype)
+    atr_out = np.full(n, np.nan, dtype=close.dtype)
+    adx_out = np.full(n, np.nan, dtype=close.dtype)
+
+    s = 0.0  # BB running sum / sum of squares
+    s2 = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    atr_val = 0.0  # ATR(p_atr)
+    atr_adx = 0.0  # ATR(p_adx), the one ADX divides by
+    adx_val = 0.0
+    adx_seed_n = 0  # non-NaN dx values in the ADX seed (nanmean, as in adx)
+    for i in range(n):
+        h = np.float64(high[i])
+        lo = np.float64(low[i])
+        c = np.float64(close[i])
+
+        # Bollinger bands
+        s += c
+        s2 += c * c
+        if i >= w_bb:
+            y = np.float64(close[i - w_bb])
+            s -= y
+            s2 -= y * y
+        if i >= w_bb - 1:
+            mean = s / w_bb
+            sd = np.sqrt(max(s2 / w_bb - mean * mean, 0.0))
+            lower[i] = mean - k * sd
+            mid[i] = mean
+            upper[i] = mean + k * sd
+
+        if i == 0:
+            continue
+        pc = np.float64(close[i - 1])
+        ph = np.float64(high[i - 1])
+        pl = np.float64(low[i - 1])
+
+        # RSI: mean of the first p_rsi moves, then Wilder smoothing
+        diff = c - pc
+        gain = max(diff, 0.0)
+        loss = max(-diff, 0.0)
+        if i < p_rsi:
+            avg_gain += gain
+            avg_loss += loss
+        elif i == p_rsi:
+            avg_gain = (avg_gain + gain) / p_rsi
+            avg_loss = (avg_loss + loss) / p_rsi
+        else:
+            avg_gain = (avg_gain * (p_rsi - 1) + gain) / p_rsi
+            avg_loss = (avg_loss * (p_rsi - 1) + loss) / p_rsi
+            rsi_out[i] = 100 - 100 / (1 + avg_gain / (avg_loss + 1e-10))
+
+        # ATR, once per period
+        tr = max(h - lo, abs(h - pc), abs(lo - pc))
+        if i < p_atr:
+            atr_val += tr
+        elif i == p_atr:
+            atr_val = (atr_val + tr) / p_atr
+            atr_out[i] = atr_val
+        else:
+            atr_val = (atr_val * (p_atr - 1) + tr) / p_atr
+            atr_out[i] = atr_val
+        if i < p_adx:
+            atr_adx += tr
+            continue
+        if i == p_adx:
+            atr_adx = (atr_adx + tr) / p_adx
+        else:
+            atr_adx = (atr_adx * (p_adx - 1) + tr) / p_adx
+
+        # ADX: mean of dx over [p_adx, 2 * p_adx], then Wilder smoothing
+        plus_dm = max(h - ph, 0.0)
+        minus_dm = max(pl - lo, 0.0)
+        if plus_dm < minus_dm:
+            plus_dm = 0.0
+        if minus_dm <= plus_dm:
+            minus_dm = 0.0
+        if atr_adx > 0:
+            plus_di = 100 * plus_dm / atr_adx
+            minus_di = 100 * minus_dm / atr_adx
+            di_sum = plus_di + minus_di
+            dx = 100 * abs(plus_di - minus_di) / (di_sum + 1e-10) if di_sum != 0 else 0.0
+        else:
+            dx = np.nan  # no range yet: undefined, like 0/0 in adx
+        if i <= 2 * p_adx:
+            if not np.isnan(dx):
+                adx_val += dx
+                adx_seed_n += 1
+            if i == 2 * p_adx:
+                adx_val = adx_val / adx_seed_n if adx_seed_n else np.nan
+                adx_out[i] = adx_val
+        else:
+            adx_val = (adx_val * (p_adx - 1) + dx) / p_adx
+            adx_out[i] = adx_val
+
+    return lower, mid, upper, rsi_out, atr_out, adx_out
+
+
+def _as_float(arr: np.ndarray) -> np.ndarray:
+    """Keep float32 input as is (outputs follow it), compute anything else in float64."""
+    return arr if arr.dtype == np.float32 else arr.astype(np.float64, copy=False)
+
+
+def _check_window(arr: np.ndarray, window: int) -> None:
+    if window > arr.size:
+        raise ValueError("window too large")
+
+
 def sma(arr: np.ndarray, window: int) -> np.ndarray:
-    rw = _rolling_window(arr, window)
-    res = np.empty_like(arr, dtype=float)
-    res[: window - 1] = np.nan
-    res[window - 1 :] = rw.mean(axis=1)
-    return res
+    _check_window(arr, window)
+    return _move_mean(_as_float(arr), window)
 
 
 def std(arr: np.ndarray, window: int) -> np.ndarray:
-    rw = _rolling_window(arr, window)
-    res = np.empty_like(arr, dtype=float)
-    res[: window - 1] = np.nan
-    res[window - 1 :] = rw.std(axis=1, ddof=0)
-    return res
+    _check_window(arr, window)
+    return _move_std(_as_float(arr), window)
 
 
 # ----------------------------------------------------------------------
@@ -40,29 +268,21 @@ def std(arr: np.ndarray, window: int) -> np.ndarray:
 
 
 def bollinger_bands(close: np.ndarray, window: int = 20, num_std: float = 2.0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    ma = sma(close, window)
-    sd = std(close, window)
-    upper = ma + num_std * sd
-    lower = ma - num_std * sd
-    return lower, ma, upper
+    _check_window(close, window)
+    return _bb_loop(_as_float(close), window, num_std)
 
 
-def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+def rsi_averages(close: np.ndarray, period: int = 14) -> tuple[np.ndarray, np.ndarray]:
+    """Wilder-smoothed average gain and loss underlying :func:`rsi`."""
+    close = _as_float(close)
     diff = np.diff(close, prepend=close[0])
     gain = np.clip(diff, 0, None)
     loss = -np.clip(diff, None, 0)
-    avg_gain = np.empty_like(close, dtype=float)
-    avg_loss = np.empty_like(close, dtype=float)
-
-    avg_gain[:period] = np.nan
-    avg_loss[:period] = np.nan
+    return _rsi_loop(gain, loss, period)
 
-    avg_gain[period] = gain[1 : period + 1].mean()
-    avg_loss[period] = loss[1 : period + 1].mean()
 
-    for i in range(period + 1, len(close)):
-        avg_gain[i] = (avg_gain[i - 1] * (period - 1) + gain[i]) / period
-        avg_loss[i] = (avg_loss[i - 1] * (period - 1) + loss[i]) / period
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    avg_gain, avg_loss = rsi_averages(close, period)
 
     rs = avg_gain / (avg_loss + 1e-10)
     rsi = 100 - 100 / (1 + rs)
@@ -71,32 +291,59 @@ def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
 
 
 def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
-    prev_close = np.roll(close, 1)
-    prev_close[0] = close[0]
-    tr = np.maximum(high - low, np.maximum(abs(high - prev_close), abs(low - prev_close)))
-    atr = np.empty_like(close, dtype=float)
-    atr[:period] = np.nan
-    atr[period] = tr[1 : period + 1].mean()
-    for i in range(period + 1, len(close)):
-        atr[i] = (atr[i - 1] * (period - 1) + tr[i]) / period
-    return atr
+    # True range from shifted slices; tr[0] has no previous close and is
+    # never read by the Wilder seed.
+    tr = _as_float(high - low)
+    hc = np.abs(high[1:] - close[:-1])
+    np.maximum(hc, np.abs(low[1:] - close[:-1]), out=hc)
+    np.maximum(tr[1:], hc, out=tr[1:])
+    return _atr_loop(tr, period)
 
 
 def adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
-    plus_dm = np.maximum(high - np.roll(high, 1), 0)
-    minus_dm = np.maximum(np.roll(low, 1) - low, 0)
+    high = _as_float(high)
+    low = _as_float(low)
+    plus_dm = np.zeros_like(high)
+    minus_dm = np.zeros_like(low)
+    np.maximum(high[1:] - high[:-1], 0, out=plus_dm[1:])
+    np.maximum(low[:-1] - low[1:], 0, out=minus_dm[1:])
     plus_dm[plus_dm < minus_dm] = 0
     minus_dm[minus_dm <= plus_dm] = 0
 
     atr_val = atr(high, low, close, period)
 
-    plus_di = 100 * np.divide(plus_dm, atr_val, where=~np.isnan(atr_val))
-    minus_di = 100 * np.divide(minus_dm, atr_val, where=~np.isnan(atr_val))
-    dx = 100 * np.divide(np.abs(plus_di - minus_di), plus_di + minus_di + 1e-10, where=(plus_di + minus_di) != 0)
+    valid = ~np.isnan(atr_val)
+    plus_di = 100 * np.divide(plus_dm, atr_val, out=np.zeros_like(atr_val), where=valid)
+    minus_di = 100 * np.divide(minus_dm, atr_val, out=np.zeros_like(atr_val), where=valid)
+    di_sum = plus_di + minus_di
+    dx = 100 * np.divide(np.abs(plus_di - minus_di), di_sum + 1e-10, out=np.zeros_like(di_sum), where=di_sum != 0)
+
+    return _adx_loop(dx, period)
+
+
+def compute_all(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    window_bb: int = 20,
+    num_std: float = 2.0,
+    period_rsi: int = 14,
+    period_atr: int = 14,
+    period_adx: int = 14,
+) -> dict[str, np.ndarray]:
+    """All strategy indicators from one fused pass.
+
+    Returns ``lower``, ``mid``, ``upper``, ``rsi``, ``atr`` and ``adx``,
+    equal to calling the individual functions above.
+    """
+    _check_window(close, window_bb)
+    lower, mid, upper, rsi_, atr_, adx_ = _compute_all(
+        _as_float(high), _as_float(low), _as_float(close),
+        window_bb, period_rsi, period_atr, period_adx, num_std,
+    )
+    return {"lower": lower, "mid": mid, "upper": upper, "rsi": rsi_, "atr": atr_, "adx": adx_}
+
 
-    adx = np.empty_like(close, dtype=float)
-    adx[: 2 * period] = np.nan
-    adx[2 * period] = np.nanmean(dx[period : 2 * period + 1])
-    for i in range(2 * period + 1, len(close)):
-        adx[i] = (adx[i - 1] * (period - 1) + dx[i]) / period
-    return adx
+def wilder_step(prev: float, value: float, period: int) -> float:
+    """Advance a Wilder moving average by one observation."""
+    return (prev * (period - 1) + value) / period
@@ -3,15 +3,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 from .engine import MeanReversionEngine
 from .exchange import Exchange
 from .notifier import TelegramNotifier
 from .risk_guard import RiskGuard
+from .strategy.mean_reversion import MeanReversionSignal
 
 logger = logging.getLogger(__name__)
 
+_BATCH_MIN_SYMBOLS = 4  # below this, engines size their own entries
+_BATCH_INTERVAL = 1.0  # seconds between batched entry passes
+
 
 class EngineManager:
     def __init__(self, settings: dict) -> None:
@@ -24,6 +30,7 @@ class EngineManager:
         self.notifier = TelegramNotifier(
             token=settings["telegram"]["bot_token"],
             chat_id=settings["telegram"]["chat_id"],
+            session=self.exchange._session,
         )
         self.risk_guard = RiskGuard(
             max_daily_drawdown=settings["risk_guard"]["daily_drawdown"],
@@ -33,18 +40,98 @@ class EngineManager:
             max_total_risk=settings["risk_guard"]["max_total_risk"],
         )
         self.engines: List[MeanReversionEngine] = []
+        # engine -> (side, close, atr) of its latest entry signal
+        self._pending: Dict[MeanReversionEngine, Tuple[str, float, float]] = {}
 
     async def start(self) -> None:
-        for sym in self.settings["symbols"]:
+        # Force JIT compilation of the indicator kernels before any market
+        # data arrives (cache=True reuses the result on later restarts).
+        warmup = np.random.rand(120, 6)
+        MeanReversionSignal().generate(warmup)
+        MeanReversionSignal()._indicators_incremental(warmup)
+        logger.info("Indicator kernels ready")
+        symbols = self.settings["symbols"]
+        if isinstance(symbols, dict):  # ``[symbols]`` table in settings.toml
+            symbols = symbols["symbols"]
+        batched = len(symbols) >= _BATCH_MIN_SYMBOLS
+        for sym in symbols:
             engine = MeanReversionEngine(
                 symbol=sym,
                 exchange=self.exchange,
                 notifier=self.notifier,
                 risk_guard=self.risk_guard,
                 settings=self.settings["trading"],
+                entry_sink=self._queue_entry if batched else None,
             )
             self.engines.append(engine)
             await engine.start()
-        logger.info("%d engines started", len(self.engines))
+        logger.info("%d engines started (batched entries: %s)", len(self.engines), batched)
         while True:
-            await asyncio.sleep(60)
+            if not batched:
+                await asyncio.sleep(60)
+                continue
+            await asyncio.sleep(_BATCH_INTERVAL)
+            try:
+                await self._evaluate_batch()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.exception("Batch entry error: %s", exc)
+
+    # ----------------------------------------------------------
+    # Batched entries
+    # ----------------------------------------------------------
+
+    def _queue_entry(
+        self, engine: MeanReversionEngine, candidate: Tuple[str, float, float] | None
+    ) -> None:
+        if candidate is None:
+            self._pending.pop(engine, None)
+        else:
+            self._pending[engine] = candidate
+
+    async def _evaluate_batch(self) -> None:
+        """Size every pending entry with one vectorised pass, then place orders."""
+        if not self._pending:
+            return
+        if not self.risk_guard.is_trading_allowed():
+            # drawdown / profit lock tripped after the candidates were queued
+            self._pending.clear()
+            return
+        pending, self._pending = self._pending, {}
+        engines = [e for e in pending if e.position is None]
+        if not engines:
+            return
+        balance = await self.exchange.wallet_balance()
+        risk_usdt = balance * self.settings["trading"]["risk_per_trade"]
+
+        sides = [pending[e][0] for e in engines]
+        close = np.array([pending[e][1] for e in engines])
+        atr_val = np.array([pending[e][2] for e in engines])
+        sizing = [e.sizing for e in engines]
+        max_sl_pct = np.array([p.max_sl_pct for p in sizing])
+        atr_mult = np.array([p.atr_mult_stop for p in sizing])
+        lev = np.array([p.leverage for p in sizing])
+        qty_step = np.array([p.qty_step for p in sizing])
+        inv_step = 1.0 / qty_step
+
+        # Same formulas as MeanReversionSignal.initial_sl and
+        # MeanReversionEngine._safe_qty_calc/_floor_qty, for all symbols at once.
+        sl_dist = np.fmin(max_sl_pct * close, atr_mult * atr_val)
+        sign = np.where(np.array(sides) == "long", -1.0, 1.0)
+        sl_price = close + sign * sl_dist
+        stop_dist = np.abs(close - sl_price)  # as the engine measures it
+        with np.errstate(divide="ignore", invalid="ignore"):
+            qty = np.where(stop_dist != 0, risk_usdt / stop_dist * lev, 0.0)
+        qty = np.floor(qty * inv_step + 1e-9) * qty_step
+
+        results = await asyncio.gather(
+            *(
+                e.submit_entry(
+                    sides[i], float(close[i]), float(sl_price[i]), round(float(qty[i]), sizing[i].qty_digits), risk_usdt
+                )
+                for i, e in enumerate(engines)
+            ),
+            return_exceptions=True,
+        )
+        for e, res in zip(engines, results):
+            if isinstance(res, Exception):
+                logger.error("Entry for %s failed: %s", e.symbol, res)
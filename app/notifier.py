@@ -4,31 +4,66 @@ from __future__ import annotations
 import asyncio
 import logging
 
-logger = logging.getLogger(__name__)
+import aiohttp
 
-try:
-    from telegram import Bot  # type: ignore
-except Exception:  # pragma: no cover - optional dependency
-    class Bot:
-        """Fallback bot when python-telegram-bot is missing."""
+logger = logging.getLogger(__name__)
 
-        def __init__(self, *_, **__):
-            logger.warning(
-                "python-telegram-bot not installed; Telegram notifications disabled"
-            )
+_API_URL = "https://api.telegram.org/bot{token}/sendMessage"
+_QUEUE_SIZE = 100
+_BATCH_MAX = 10  # messages coalesced into one post
+_BATCH_WINDOW = 0.1  # seconds to wait for more messages to coalesce
 
-        async def send_message(self, chat_id: str, text: str) -> None:  # noqa: D401
-            logger.info("[MOCK TG] %s: %s", chat_id, text)
 
 class TelegramNotifier:
-    def __init__(self, token: str, chat_id: str) -> None:
-        self.bot = Bot(token=token)
+    """Posts messages to the Bot API from a background worker.
+
+    ``send`` only enqueues, so callers never wait on Telegram. The worker
+    coalesces messages arriving within ``_BATCH_WINDOW`` into one post.
+    """
+
+    def __init__(self, token: str, chat_id: str, session: aiohttp.ClientSession) -> None:
         self.chat_id = chat_id
-        # Ensure network I/O is run asynchronously
-        self._loop = asyncio.get_event_loop()
+        self._url = _API_URL.format(token=token) if token else None
+        self._session = session
+        self._timeout = aiohttp.ClientTimeout(total=5)
+        self._q: asyncio.Queue[str] = asyncio.Queue(maxsize=_QUEUE_SIZE)
+        self._worker_task: asyncio.Task | None = None
+
+    def send(self, text: str) -> None:
+        """Queue ``text`` for delivery; drops the oldest message when full."""
+        if self._url is None:
+            logger.info("[MOCK TG] %s: %s", self.chat_id, text)
+            return
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._worker())
+        if self._q.full():
+            dropped = self._q.get_nowait()
+            logger.warning("Telegram queue full, dropping: %s", dropped)
+        self._q.put_nowait(text)
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._q.get()]
+            deadline = loop.time() + _BATCH_WINDOW
+            while len(batch) < _BATCH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._q.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._post("\n".join(batch))
 
-    async def send(self, text: str) -> None:
+    async def _post(self, text: str) -> None:
         try:
-            await self.bot.send_message(chat_id=self.chat_id, text=text)
+            async with self._session.post(
+                self._url,
+                json={"chat_id": self.chat_id, "text": text},
+                timeout=self._timeout,
+            ) as resp:
+                if resp.status != 200:
+                    logger.error("Telegram send failed: HTTP %s %s", resp.status, await resp.text())
         except Exception as exc:  # pylint: disable=broad-except
             logger.error("Telegram send failed: %s", exc)
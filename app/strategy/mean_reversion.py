@@ -1,9 +1,11 @@
 """Mean-reversion strategy rules."""
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
-from ..indicators import adx, atr, bollinger_bands, rsi
+from ..indicators import adx, atr, compute_all, rsi_averages, wilder_step
 
 
 class MeanReversionSignal:
@@ -24,24 +26,135 @@ class MeanReversionSignal:
         self.period_adx = period_adx
         self.atr_mult_trailing = atr_mult_trailing
         self.atr_mult_stop = atr_mult_stop
+        self.max_sl_pct = 0.015  # stop never further than 1.5 % from entry
+        # (key, indicators) of the last evaluated candle array
+        self._cache: tuple | None = None
+        # Wilder state as of the last closed candle, see _indicators_incremental
+        self._ind_state: dict | None = None
 
     # --------------------------------------------------------------
     # Helpers
     # --------------------------------------------------------------
 
     def _indicators(self, candles: np.ndarray) -> dict[str, np.ndarray]:
+        # The last row is the only one that changes between ticks (it is
+        # updated in place until the minute closes), so it is part of the key.
+        key = (candles.shape[0], tuple(candles[-1].tolist()))
+        if self._cache is not None and self._cache[0] == key:
+            return self._cache[1]
         close = candles[:, 3]
         high = candles[:, 1]
         low = candles[:, 2]
-        lower, mid, upper = bollinger_bands(close, self.window_bb, self.num_std)
+        ind = compute_all(
+            high,
+            low,
+            close,
+            window_bb=self.window_bb,
+            num_std=self.num_std,
+            period_rsi=self.period_rsi,
+            period_atr=self.period_atr,
+            period_adx=self.period_adx,
+        )
+        ind["close"] = close
+        self._cache = (key, ind)
+        return ind
+
+    def _indicators_incremental(self, candles: np.ndarray) -> dict[str, np.ndarray]:
+        """Indicators of the last candle, updated in O(1) per new candle.
+
+        Every row but the last is treated as closed. The Wilder averages are
+        advanced once per newly closed row and the last (in-progress) row is
+        applied on top without being stored. Returns the same keys as
+        :meth:`_indicators`, each holding only the last bar.
+        """
+        closed = candles[:-1]
+        st = self._ind_state
+        start = 0
+        if st is not None:
+            start = int(np.searchsorted(closed[:, 0], st["ts"]))
+            if start < len(closed) and closed[start, 0] == st["ts"]:
+                start += 1
+            else:
+                st = None  # history no longer contains the state's candle
+        if st is None:
+            warmup = max(self.window_bb - 1, self.period_rsi, self.period_atr, 2 * self.period_adx)
+            if len(closed) <= warmup:
+                return self._indicators(candles)
+            st = self._init_state(closed)
+            start = len(closed)
+        for row in closed[start:]:
+            st = self._advance(st, row)
+        if any(math.isnan(v) for v in st.values()):
+            # NaN never washes out of a Wilder average (e.g. ADX after a flat
+            # stretch); drop the state and re-seed from the window next time.
+            self._ind_state = None
+            return self._indicators(candles)
+        self._ind_state = st
+
+        last = self._advance(st, candles[-1])
+        window = candles[-self.window_bb :, 3]
+        mid = window.mean()
+        sd = window.std()
+        rs = last["avg_gain"] / (last["avg_loss"] + 1e-10)
+        return {
+            "close": np.array([last["close"]]),
+            "lower": np.array([mid - self.num_std * sd]),
+            "mid": np.array([mid]),
+            "upper": np.array([mid + self.num_std * sd]),
+            "rsi": np.array([100 - 100 / (1 + rs)]),
+            "adx": np.array([last["adx"]]),
+            "atr": np.array([last["atr"]]),
+        }
+
+    def _init_state(self, closed: np.ndarray) -> dict:
+        close = closed[:, 3]
+        high = closed[:, 1]
+        low = closed[:, 2]
+        avg_gain, avg_loss = rsi_averages(close, self.period_rsi)
         return {
+            "ts": closed[-1, 0],
+            "close": close[-1],
+            "high": high[-1],
+            "low": low[-1],
+            "avg_gain": avg_gain[-1],
+            "avg_loss": avg_loss[-1],
+            "atr": atr(high, low, close, self.period_atr)[-1],
+            "atr_adx": atr(high, low, close, self.period_adx)[-1],
+            "adx": adx(high, low, close, self.period_adx)[-1],
+        }
+
+    def _advance(self, st: dict, row: np.ndarray) -> dict:
+        """Return ``st`` advanced by one candle row (``st`` is not modified)."""
+        ts, high, low, close = float(row[0]), float(row[1]), float(row[2]), float(row[3])
+        prev_close = st["close"]
+        diff = close - prev_close
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        atr_adx = wilder_step(st["atr_adx"], tr, self.period_adx)
+
+        plus_dm = max(high - st["high"], 0.0)
+        minus_dm = max(st["low"] - low, 0.0)
+        if plus_dm < minus_dm:
+            plus_dm = 0.0
+        if minus_dm <= plus_dm:
+            minus_dm = 0.0
+        if atr_adx > 0:
+            plus_di = 100 * plus_dm / atr_adx
+            minus_di = 100 * minus_dm / atr_adx
+            di_sum = plus_di + minus_di
+            dx = 100 * abs(plus_di - minus_di) / (di_sum + 1e-10) if di_sum != 0 else 0.0
+        else:
+            dx = math.nan
+
+        return {
+            "ts": ts,
             "close": close,
-            "lower": lower,
-            "mid": mid,
-            "upper": upper,
-            "rsi": rsi(close, self.period_rsi),
-            "adx": adx(high, low, close, self.period_adx),
-            "atr": atr(high, low, close, self.period_atr),
+            "high": high,
+            "low": low,
+            "avg_gain": wilder_step(st["avg_gain"], max(diff, 0.0), self.period_rsi),
+            "avg_loss": wilder_step(st["avg_loss"], max(-diff, 0.0), self.period_rsi),
+            "atr": wilder_step(st["atr"], tr, self.period_atr),
+            "atr_adx": atr_adx,
+            "adx": wilder_step(st["adx"], dx, self.period_adx),
         }
 
     # --------------------------------------------------------------
@@ -49,26 +162,34 @@ class MeanReversionSignal:
     # --------------------------------------------------------------
 
     def generate(self, candles: np.ndarray) -> str:
-        ind = self._indicators(candles)
-        i = -1  # last bar
-        if np.isnan(ind["mid"][i]):
+        return self.generate_from_ind(self._indicators(candles))
+
+    def generate_from_ind(self, ind: dict[str, np.ndarray]) -> str:
+        # last bar as Python floats: cheaper to compare than numpy scalars
+        close, lower, upper, rsi_, adx_, mid = (
+            float(ind[k][-1]) for k in ("close", "lower", "upper", "rsi", "adx", "mid")
+        )
+        if math.isnan(mid):
             return "none"
         # Entry filters
-        if ind["adx"][i] >= 25:
+        if adx_ >= 25:
             return "none"
-        if ind["close"][i] < ind["lower"][i] and ind["rsi"][i] < 30:
+        if close < lower and rsi_ < 30:
             return "long"
-        if ind["close"][i] > ind["upper"][i] and ind["rsi"][i] > 70:
+        if close > upper and rsi_ > 70:
             return "short"
         return "none"
 
     def should_exit(self, side: str, candles: np.ndarray, entry_price: float) -> tuple[bool, float]:
-        ind = self._indicators(candles)
-        i = -1
-        close = ind["close"][i]
-        mid = ind["mid"][i]
-        atr_val = ind["atr"][i]
-        if np.isnan(mid) or np.isnan(atr_val):
+        return self.should_exit_from_ind(side, self._indicators(candles), entry_price)
+
+    def should_exit_from_ind(
+        self, side: str, ind: dict[str, np.ndarray], entry_price: float
+    ) -> tuple[bool, float]:
+        close = float(ind["close"][-1])
+        mid = float(ind["mid"][-1])
+        atr_val = float(ind["atr"][-1])
+        if math.isnan(mid) or math.isnan(atr_val):
             return False, 0.0
         # primary exit: touch mid
         if (side == "long" and close >= mid) or (side == "short" and close <= mid):
@@ -82,5 +203,6 @@ class MeanReversionSignal:
         return False, 0.0
 
     def initial_sl(self, side: str, atr_val: float, entry_price: float) -> float:
-        sl_dist = min(0.015 * entry_price, self.atr_mult_stop * atr_val)
-        return entry_price - sl_dist if side == "long" else entry_price + sl_dist
+        sl_dist = min(self.max_sl_pct * entry_price, self.atr_mult_stop * atr_val)
+        sign = -1.0 if side == "long" else 1.0
+        return entry_price + sign * sl_dist
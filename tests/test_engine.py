@@ -0,0 +1,184 @@
+import asyncio
+
+import numpy as np
+
+from app.engine import MeanReversionEngine
+from app.manager import EngineManager
+
+
+def _engine(**settings) -> MeanReversionEngine:
+    return MeanReversionEngine("BTCUSDT", None, None, None, settings)
+
+
+def test_floor_qty_to_step():
+    eng = _engine(qty_step=0.001)
+    assert eng._floor_qty(0.0123) == 0.012
+    assert eng._floor_qty(0.0029999999) == 0.002
+    assert eng._floor_qty(0.29) == 0.29
+    assert eng._floor_qty(0.0004) == 0.0
+
+    assert _engine(qty_step=1)._floor_qty(2.7) == 2
+    assert _engine(qty_step=0.1)._floor_qty(0.35) == 0.3
+    assert _engine(qty_step=1e-7)._floor_qty(0.00001234567) == 0.0000123
+
+
+def test_entry_candidate_withdrawn_when_signal_gone():
+    pending = {}
+
+    def sink(engine, candidate):
+        if candidate is None:
+            pending.pop(engine, None)
+        else:
+            pending[engine] = candidate
+
+    class Guard:
+        def is_trading_allowed(self):
+            return True
+
+    eng = MeanReversionEngine("BTCUSDT", None, None, Guard(), {}, entry_sink=sink)
+    eng._cn = 100
+    eng._cbuf[:100] = 100.0
+    signals = iter(["long", "none"])
+    eng.strategy._indicators_incremental = lambda candles: {"atr": np.array([1.0])}
+    eng.strategy.generate_from_ind = lambda ind: next(signals)
+
+    asyncio.run(eng._evaluate())
+    assert pending[eng] == ("long", 100.0, 1.0)
+    asyncio.run(eng._evaluate())
+    assert eng not in pending
+
+
+def test_candles_aggregated_into_ring_buffer():
+    rng = np.random.default_rng(5)
+    eng = _engine()
+    expected = {}
+    for minute in range(1203):
+        prices = np.round(100 + rng.normal(0, 1, 4), 2)
+        vols = np.round(rng.random(4), 3)
+        trades = [
+            {"T": minute * 60000 + j * 1000, "p": str(p), "v": str(v)}
+            for j, (p, v) in enumerate(zip(prices, vols))
+        ]
+        if minute % 7 == 3:
+            # late trade for the previous minute: must be dropped
+            trades.append({"T": (minute - 1) * 60000 + 59000, "p": "1000", "v": "50"})
+        eng._on_trade({"data": trades[:2]})
+        if minute % 5 == 0:
+            asyncio.run(eng._build_candle())  # publish the in-progress candle
+        eng._on_trade({"data": trades[2:]})
+        expected[minute] = [minute * 60, prices[0], prices.max(), prices.min(), prices[-1], vols.sum()]
+    asyncio.run(eng._build_candle())
+
+    candles = eng._contiguous()
+    assert candles.shape == (500, 6)
+    assert candles.flags["C_CONTIGUOUS"]
+    np.testing.assert_allclose(candles, np.array([expected[m] for m in range(703, 1203)]))
+
+
+class FakeExchange:
+    def __init__(self, balance: float = 10000.0) -> None:
+        self.balance = balance
+        self.orders = []
+
+    async def wallet_balance(self) -> float:
+        return self.balance
+
+    async def create_order(self, **kwargs):
+        self.orders.append(kwargs)
+        return {"result": {"orderId": str(len(self.orders))}}
+
+
+_SETTINGS = {
+    "bybit": {"api_key": "k", "api_secret": "s"},
+    "telegram": {"bot_token": "", "chat_id": "1"},
+    "risk_guard": {
+        "daily_drawdown": -5.0,
+        "profit_lock": 5.0,
+        "max_trades": 20,
+        "max_positions": 8,
+        "max_total_risk": 1e9,
+    },
+    "trading": {"leverage": 10, "risk_per_trade": 0.01, "qty_step": 0.001},
+    "symbols": ["A", "B", "C", "D"],
+}
+
+
+def _manager(exchange: FakeExchange) -> EngineManager:
+    async def build():
+        manager = EngineManager(_SETTINGS)
+        await manager.exchange.close()
+        manager.exchange = exchange
+        return manager
+
+    return asyncio.run(build())
+
+
+def _batched_engine(manager: EngineManager, symbol: str) -> MeanReversionEngine:
+    eng = MeanReversionEngine(
+        symbol,
+        manager.exchange,
+        manager.notifier,
+        manager.risk_guard,
+        _SETTINGS["trading"],
+        entry_sink=manager._queue_entry,
+    )
+    manager.engines.append(eng)
+    return eng
+
+
+def test_batch_skips_entries_once_trading_disallowed():
+    exchange = FakeExchange()
+    manager = _manager(exchange)
+    eng = _batched_engine(manager, "A")
+    manager._queue_entry(eng, ("long", 100.0, 1.0))
+
+    manager.risk_guard.register_trade(-6.0, 0.0)  # daily drawdown tripped
+    asyncio.run(manager._evaluate_batch())
+    assert exchange.orders == []
+    assert not manager._pending
+
+
+def test_entry_candidate_withdrawn_when_trading_disallowed():
+    manager = _manager(FakeExchange())
+    eng = _batched_engine(manager, "A")
+    eng._cn = 100
+    eng._cbuf[:100] = 100.0
+    eng.strategy._indicators_incremental = lambda candles: {"atr": np.array([1.0])}
+    eng.strategy.generate_from_ind = lambda ind: "long"
+
+    asyncio.run(eng._evaluate())
+    assert eng in manager._pending
+    manager.risk_guard.register_trade(-6.0, 0.0)
+    asyncio.run(eng._evaluate())
+    assert eng not in manager._pending
+
+
+def test_batched_sizing_matches_per_engine():
+    cases = {
+        "A": ("long", 100.0, 0.5),  # ATR stop (0.75) inside the 1.5 % cap
+        "B": ("short", 250.0, 5.0),  # ATR stop 7.5 capped at 3.75
+        "C": ("long", 60123.4, 900.0),  # capped
+        "D": ("short", 3.3217, 0.01),  # ATR stop
+    }
+
+    single = {}
+    for sym, (side, close, atr_val) in cases.items():
+        exchange = FakeExchange()
+        manager = _manager(exchange)
+        eng = MeanReversionEngine(sym, exchange, manager.notifier, manager.risk_guard, _SETTINGS["trading"])
+        candles = np.full((1, 6), close)
+        asyncio.run(eng._open_position(side, candles, {"atr": np.array([atr_val])}))
+        single[sym] = exchange.orders[0]
+
+    exchange = FakeExchange()
+    manager = _manager(exchange)
+    for sym, candidate in cases.items():
+        manager._queue_entry(_batched_engine(manager, sym), candidate)
+    asyncio.run(manager._evaluate_batch())
+
+    batched = {order["symbol"]: order for order in exchange.orders}
+    assert batched.keys() == cases.keys()
+    for sym, order in single.items():
+        assert batched[sym]["side"] == order["side"]
+        assert batched[sym]["qty"] == order["qty"], sym
+        assert batched[sym]["sl"] == order["sl"], sym
@@ -0,0 +1,85 @@
+import asyncio
+import hashlib
+import hmac
+from urllib.parse import urlsplit
+
+import pytest
+
+from app.exchange import BybitError, Exchange
+
+_KEY = "api-key"
+_SECRET = "api-secret"
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: bytes) -> None:
+        self.status = status
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        return False
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+class FakeSession:
+    closed = False
+
+    def __init__(self, status: int = 200, body: bytes = b'{"retCode":0,"result":{"orderId":"1","list":[]}}') -> None:
+        self.status = status
+        self.body = body
+        self.calls = []
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        self.calls.append({"method": method, "url": url, "data": data, "headers": headers, "timeout": timeout})
+        return FakeResponse(self.status, self.body)
+
+
+def _expected_sign(headers: dict, payload: str) -> str:
+    msg = headers["X-BAPI-TIMESTAMP"] + _KEY + headers["X-BAPI-RECV-WINDOW"] + payload
+    return hmac.new(_SECRET.encode(), msg.encode(), hashlib.sha256).hexdigest()
+
+
+def test_post_signs_exact_body():
+    session = FakeSession()
+    ex = Exchange(_KEY, _SECRET, session=session)
+    asyncio.run(ex.create_order("BTCUSDT", "Buy", "Market", 0.012, sl=99.5))
+
+    call = session.calls[0]
+    assert call["method"] == "POST"
+    assert call["url"].endswith("/v5/order/create")
+    assert isinstance(call["data"], str) and '"stopLoss":"99.5"' in call["data"].replace(" ", "")
+    assert call["headers"]["X-BAPI-API-KEY"] == _KEY
+    assert call["headers"]["X-BAPI-SIGN"] == _expected_sign(call["headers"], call["data"])
+    assert call["timeout"] is not None
+
+
+def test_get_signs_query_string():
+    session = FakeSession()
+    ex = Exchange(_KEY, _SECRET, session=session)
+    asyncio.run(ex.positions("BTCUSDT"))
+
+    call = session.calls[0]
+    assert call["method"] == "GET"
+    assert call["data"] is None
+    query = urlsplit(call["url"]).query
+    assert query == "category=linear&symbol=BTCUSDT"
+    assert call["headers"]["X-BAPI-SIGN"] == _expected_sign(call["headers"], query)
+
+
+def test_nonzero_ret_code_raises():
+    session = FakeSession(body=b'{"retCode":10004,"retMsg":"error sign!"}')
+    ex = Exchange(_KEY, _SECRET, session=session)
+    with pytest.raises(BybitError, match="10004"):
+        asyncio.run(ex.wallet_balance())
+
+
+def test_http_error_raises():
+    session = FakeSession(status=403, body=b"<html>Forbidden</html>")
+    ex = Exchange(_KEY, _SECRET, session=session)
+    with pytest.raises(BybitError, match="403"):
+        asyncio.run(ex.cancel_order("BTCUSDT", "1"))
@@ -1,6 +1,6 @@
 import numpy as np
 
-from app.indicators import bollinger_bands, rsi, atr, adx
+from app.indicators import bollinger_bands, compute_all, rsi, atr, adx, std
 
 
 def test_bollinger_shape():
@@ -32,3 +32,79 @@ def test_adx_nan_start():
     close = (high + low) / 2
     out = adx(high, low, close)
     assert np.isnan(out[:28]).all()  # 2*14 window
+
+
+def _btc_series(step: float, n: int = 300, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    close = 60000 + np.cumsum(rng.normal(0, step, n))
+    high = close + rng.random(n) * step
+    low = close - rng.random(n) * step
+    return high, low, close
+
+
+def test_float32_matches_float64():
+    # a volatile and a quiet market at BTC-scale prices
+    for step in (50.0, 0.5):
+        high, low, close = _btc_series(step)
+        h32, l32, c32 = (a.astype(np.float32) for a in (high, low, close))
+
+        lower, mid, upper = bollinger_bands(close)
+        lower32, mid32, upper32 = bollinger_bands(c32)
+        fused32 = compute_all(h32, l32, c32)
+        assert mid32.dtype == np.float32
+        sigma = np.nanmin(upper - mid)
+        for width32 in (upper32 - mid32, mid32 - lower32, fused32["upper"] - fused32["mid"]):
+            np.testing.assert_allclose(width32, upper - mid, rtol=1e-3, atol=1e-2 * sigma)
+        np.testing.assert_allclose(std(c32, 20), std(close, 20), rtol=1e-3, atol=1e-2 * sigma / 2)
+
+        # RSI/ADX react to single-tick moves, so compare against float64 on
+        # the same (float32-rounded) prices to isolate the arithmetic.
+        h, l, c = (a.astype(np.float64) for a in (h32, l32, c32))
+        for out64, out32 in (
+            (rsi(c), rsi(c32)),
+            (atr(h, l, c), atr(h32, l32, c32)),
+            (adx(h, l, c), adx(h32, l32, c32)),
+            (rsi(c), fused32["rsi"]),
+            (atr(h, l, c), fused32["atr"]),
+            (adx(h, l, c), fused32["adx"]),
+        ):
+            assert out32.dtype == np.float32
+            np.testing.assert_allclose(out32, out64, rtol=1e-4, atol=1e-4)
+
+
+def test_compute_all_matches_individual():
+    rng = np.random.default_rng(2)
+    high = rng.random(300) * 10 + 100
+    low = high - rng.random(300) * 3
+    close = (high + low) / 2
+
+    out = compute_all(high, low, close)
+    lower, mid, upper = bollinger_bands(close)
+    expected = {
+        "lower": lower,
+        "mid": mid,
+        "upper": upper,
+        "rsi": rsi(close),
+        "atr": atr(high, low, close),
+        "adx": adx(high, low, close),
+    }
+    for key, val in expected.items():
+        np.testing.assert_allclose(out[key], val, rtol=1e-9, equal_nan=True, err_msg=key)
+
+
+def test_flat_start_matches_individual():
+    # a quiet symbol: one trade per minute at the same price, then movement
+    rng = np.random.default_rng(3)
+    close = np.full(120, 100.0)
+    close[15:] += np.cumsum(rng.normal(0, 0.5, 105))
+    high = close.copy()
+    low = close.copy()
+    high[15:] += rng.random(105)
+    low[15:] -= rng.random(105)
+
+    out = compute_all(high, low, close)
+    with np.errstate(invalid="ignore"):
+        expected = adx(high, low, close)
+    np.testing.assert_allclose(out["adx"], expected, rtol=1e-9, equal_nan=True)
+    np.testing.assert_allclose(out["atr"], atr(high, low, close), rtol=1e-9, equal_nan=True)
+    assert not np.isnan(out["adx"][-1])
@@ -17,3 +17,63 @@ def test_long_signal():
 
     action = sig.generate(candles)
     assert action in ("long", "none")  # not short
+
+
+def test_indicators_cached_per_candle_array():
+    sig = MeanReversionSignal()
+    candles = np.random.rand(120, 6) * 100 + 100
+    first = sig._indicators(candles)
+    assert sig._indicators(candles.copy()) is first
+
+    candles[-1, 3] += 1.0  # in-progress bar updated
+    assert sig._indicators(candles) is not first
+
+
+def test_incremental_indicators_match_full():
+    rng = np.random.default_rng(1)
+    candles = np.empty((200, 6))
+    candles[:, 0] = np.arange(200) * 60
+    candles[:, 1] = rng.random(200) * 10 + 100
+    candles[:, 2] = candles[:, 1] - rng.random(200) * 3
+    candles[:, 3] = (candles[:, 1] + candles[:, 2]) / 2
+    candles[:, 4] = candles[:, 3]
+    candles[:, 5] = 1.0
+
+    full_sig = MeanReversionSignal()
+    inc_sig = MeanReversionSignal()
+    for n in range(40, 200, 7):
+        full = full_sig._indicators(candles[:n])
+        inc = inc_sig._indicators_incremental(candles[:n])
+        for key in ("close", "lower", "mid", "upper", "rsi", "adx", "atr"):
+            assert np.isclose(inc[key][-1], full[key][-1]), (n, key)
+
+
+def test_initial_sl_capped_and_sided():
+    sig = MeanReversionSignal()
+    assert sig.initial_sl("long", 1.0, 100.0) == 100.0 - 1.5
+    assert sig.initial_sl("short", 0.5, 100.0) == 100.0 + 0.75
+
+
+def test_incremental_recovers_after_flat_start():
+    rng = np.random.default_rng(4)
+    n = 700
+    candles = np.empty((n, 6))
+    candles[:, 0] = np.arange(n) * 60
+    close = np.full(n, 100.0)
+    close[40:] += np.cumsum(rng.normal(0, 0.5, n - 40))
+    candles[:, 1] = close
+    candles[:, 2] = close
+    candles[40:, 1] += rng.random(n - 40)
+    candles[40:, 2] -= rng.random(n - 40)
+    candles[:, 3] = close
+    candles[:, 4] = close
+    candles[:, 5] = 1.0
+
+    inc_sig = MeanReversionSignal()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for end in range(100, n + 1, 5):
+            window = candles[max(0, end - 500) : end]  # engine keeps 500 candles
+            inc = inc_sig._indicators_incremental(window)
+    full = MeanReversionSignal()._indicators(window)
+    assert not np.isnan(inc["adx"][-1])
+    assert np.isclose(inc["adx"][-1], full["adx"][-1])